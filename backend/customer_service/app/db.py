@@ -4,14 +4,29 @@ import sys
 from sqlalchemy import create_engine
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # Check if we're running tests
 IS_TESTING = "pytest" in sys.modules or os.getenv("TESTING") == "true"
 
 if IS_TESTING and os.getenv("POSTGRES_HOST") is None:
-    # Use SQLite for local testing when PostgreSQL is not available
-    DATABASE_URL = "sqlite:///./test_customers.db"
-    engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+    if os.getenv("PYTEST_KEEP_DB") == "1":
+        # Keep a SQLite file between local runs so the schema is reused.
+        # Delete the file after changing the models.
+        XDIST_WORKER = os.getenv("PYTEST_XDIST_WORKER", "gw0")
+        DATABASE_URL = f"sqlite:///./test_customers_{XDIST_WORKER}.db"
+    else:
+        # Use in-memory SQLite for local testing when PostgreSQL is not available.
+        # Each pytest-xdist worker process gets its own copy.
+        DATABASE_URL = "sqlite+pysqlite:///:memory:"
+    # StaticPool hands out a single connection, so every session sees the same
+    # database and connect() never reopens the SQLite file. NullPool would
+    # give each connect() a fresh, empty in-memory database.
+    engine = create_engine(
+        DATABASE_URL,
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
 else:
     # Use PostgreSQL for production and CI/CD
     POSTGRES_USER = os.getenv("POSTGRES_USER", "postgres")
@@ -21,9 +36,11 @@ else:
     POSTGRES_PORT = os.getenv("POSTGRES_PORT", "5432")
 
     DATABASE_URL = (
-        f"postgresql://{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
+        f"postgresql+psycopg://{POSTGRES_USER}:{POSTGRES_PASSWORD}@"
         f"{POSTGRES_HOST}:{POSTGRES_PORT}/{POSTGRES_DB}"
     )
+    # psycopg 3 prepares a query server-side by default once it has run five
+    # times on a connection, so no extra connect_args are needed
     engine = create_engine(DATABASE_URL, pool_pre_ping=True)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
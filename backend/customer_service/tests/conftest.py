@@ -0,0 +1,115 @@
+import logging
+
+import httpx
+import pytest
+import pytest_asyncio
+from app.db import Base, engine, get_db
+from app.main import app
+
+from fastapi.testclient import TestClient
+from sqlalchemy import inspect
+from sqlalchemy.orm import sessionmaker
+
+# Suppress noisy logs from SQLAlchemy/FastAPI/Uvicorn during tests for cleaner output
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
+logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
+logging.getLogger("fastapi").setLevel(logging.WARNING)
+logging.getLogger("app.main").setLevel(logging.WARNING)
+
+
+# --- Pytest Fixtures ---
+@pytest.fixture(scope="session", autouse=True)
+def setup_database_for_tests():
+    """Set up the test database. Uses SQLite for local testing, PostgreSQL for CI/CD."""
+    try:
+        logging.info("Customer Service Tests: Setting up test database...")
+
+        # Create all tables required by the application, unless they already
+        # exist (e.g. a database kept from a previous run with PYTEST_KEEP_DB=1)
+        inspector = inspect(engine)
+        if all(inspector.has_table(name) for name in Base.metadata.tables):
+            logging.info(
+                "Customer Service Tests: Reusing existing tables for test setup."
+            )
+        else:
+            Base.metadata.create_all(bind=engine)
+            logging.info(
+                "Customer Service Tests: Successfully created all tables for test setup."
+            )
+
+    except Exception as e:
+        pytest.fail(
+            f"Customer Service Tests: Failed to set up test database: {e}",
+            pytrace=True,
+        )
+
+    yield
+
+
+@pytest.fixture(scope="session")
+def _conn(setup_database_for_tests):
+    """One connection and outer transaction shared by the whole test session."""
+    connection = engine.connect()
+    transaction = connection.begin()
+    try:
+        yield connection
+    finally:
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(scope="session")
+def _session_factory(_conn):
+    """Session factory bound to the shared connection, built once."""
+    return sessionmaker(
+        bind=_conn,
+        autocommit=False,
+        autoflush=False,
+        join_transaction_mode="create_savepoint",
+    )
+
+
+@pytest.fixture(scope="session", autouse=True)
+def override_get_db_for_tests(_session_factory):
+    """Route every request's session through the shared test connection."""
+
+    def override_get_db():
+        db = _session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    yield
+    app.dependency_overrides.pop(get_db, None)
+
+
+@pytest.fixture(scope="function", autouse=True)
+def db_session_for_test(_conn, _session_factory):
+    # Every test runs inside its own SAVEPOINT, including tests that only call
+    # the API; commits made by the API only release inner SAVEPOINTs, so
+    # rolling this one back restores isolation.
+    nested = _conn.begin_nested()
+    db = _session_factory()
+
+    try:
+        yield db
+    finally:
+        db.close()
+        nested.rollback()
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Calls the app in-process over ASGI, without TestClient's sync portal."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as ac:
+        yield ac
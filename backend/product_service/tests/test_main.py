@@ -1,5 +1,6 @@
 import logging
 import os
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -18,6 +19,8 @@ logging.getLogger("uvicorn.error").setLevel(logging.WARNING)
 logging.getLogger("fastapi").setLevel(logging.WARNING)
 logging.getLogger("app.main").setLevel(logging.WARNING)
 
+_IS_SQLITE = engine.url.get_backend_name() == "sqlite"
+
 
 # --- Pytest Fixtures ---
 @pytest.fixture(scope="session", autouse=True)
@@ -27,11 +30,9 @@ def setup_database_for_tests():
         logging.info("Product Service Tests: Setting up test database...")
         
         # Clean up any existing test database file (for SQLite)
-        if "sqlite" in str(engine.url):
-            test_db_path = "./test_products.db"
-            if os.path.exists(test_db_path):
-                os.remove(test_db_path)
-                logging.info("Product Service Tests: Removed existing SQLite test database.")
+        if _IS_SQLITE:
+            Path("./test_products.db").unlink(missing_ok=True)
+            logging.info("Product Service Tests: Removed any existing SQLite test database.")
         
         # Create all tables required by the application
         Base.metadata.create_all(bind=engine)
@@ -47,11 +48,9 @@ def setup_database_for_tests():
     
     # Clean up after tests
     try:
-        if "sqlite" in str(engine.url):
-            test_db_path = "./test_products.db"
-            if os.path.exists(test_db_path):
-                os.remove(test_db_path)
-                logging.info("Product Service Tests: Cleaned up SQLite test database.")
+        if _IS_SQLITE:
+            Path("./test_products.db").unlink(missing_ok=True)
+            logging.info("Product Service Tests: Cleaned up SQLite test database.")
     except Exception as e:
         logging.warning(f"Product Service Tests: Failed to clean up test database: {e}")
 